@@ -1,14 +1,21 @@
 """Google Calendar integration for baby sleep scheduler."""
 
+import hashlib
+import os
+import random
+import time
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import orjson
+
+# Google client libraries are imported inside the functions that use them,
+# so commands that never touch the calendar don't pay their import cost
+if TYPE_CHECKING:
+    from google.oauth2.credentials import Credentials
 
 # OAuth scopes for Calendar API
 SCOPES = ["https://www.googleapis.com/auth/calendar.events"]
@@ -23,6 +30,39 @@ TOKEN_FILE = CONFIG_DIR / "token.json"
 COLOR_NAP = "5"
 COLOR_NIGHT = "9"
 
+# Process-local caches for credentials and the built service
+_creds_cache: "Credentials | None" = None
+_service_cache: "tuple[Credentials, Any] | None" = None
+
+# Socket timeout (seconds) for Calendar API requests
+HTTP_TIMEOUT = 30
+
+# Retry policy for transient API errors (rate limits, server errors)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_ATTEMPTS = 5
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# Batch request ID for yesterday's night event update
+PREVIOUS_NIGHT_KEY = "previous_night"
+
+
+class CalendarSyncError(Exception):
+    """
+    Some of a day's events failed to sync.
+
+    event_ids holds the references of everything that did sync (same shape
+    as sync_day_to_calendar's result) and should still be saved, so the
+    next sync doesn't create those events again. errors maps the failed
+    event keys to their exceptions.
+    """
+
+    def __init__(self, event_ids: dict[str, dict[str, str]], errors: dict[str, Exception]):
+        failed = ", ".join(f"{key}: {exc}" for key, exc in errors.items())
+        super().__init__(f"{len(errors)} event(s) failed to sync ({failed})")
+        self.event_ids = event_ids
+        self.errors = errors
+
 
 def get_config_dir() -> Path:
     """Get or create the config directory."""
@@ -35,12 +75,22 @@ def credentials_exist() -> bool:
     return CREDENTIALS_FILE.exists()
 
 
-def get_credentials() -> Credentials | None:
+def get_credentials() -> "Credentials | None":
     """Get valid OAuth credentials, refreshing or initiating flow as needed."""
-    creds = None
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
+    global _creds_cache
+
+    # Reuse credentials from earlier in this process while still valid
+    if _creds_cache and _creds_cache.valid:
+        return _creds_cache
+
+    creds = _creds_cache
 
     # Load existing token if available
-    if TOKEN_FILE.exists():
+    if creds is None and TOKEN_FILE.exists():
         creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
 
     # If no valid credentials, refresh or start OAuth flow
@@ -61,15 +111,47 @@ def get_credentials() -> Credentials | None:
         with open(TOKEN_FILE, "w") as token:
             token.write(creds.to_json())
 
+    _creds_cache = creds
     return creds
 
 
+def invalidate_credentials() -> None:
+    """Drop cached credentials and service so the next call reloads them."""
+    global _creds_cache, _service_cache
+    _creds_cache = None
+    _service_cache = None
+
+
 def get_calendar_service():
     """Build and return Google Calendar API service."""
+    import httplib2
+    from google_auth_httplib2 import AuthorizedHttp
+    from googleapiclient.discovery import build
+
+    global _service_cache
+
     creds = get_credentials()
     if not creds:
         return None
-    return build("calendar", "v3", credentials=creds)
+
+    # build() is not free, reuse the service while the credentials match
+    if _service_cache and _service_cache[0] is creds:
+        return _service_cache[1]
+
+    # One authorized connection pool for every request made through this
+    # service, so event syncs reuse the same keep-alive TLS connection
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT))
+
+    # Use the discovery document bundled with googleapiclient rather than
+    # fetching it over HTTP, and skip the (unused) discovery file cache
+    service = build(
+        "calendar", "v3",
+        http=http,
+        static_discovery=True,
+        cache_discovery=False
+    )
+    _service_cache = (creds, service)
+    return service
 
 
 def setup_credentials_interactive() -> bool:
@@ -110,21 +192,19 @@ def setup_credentials_interactive() -> bool:
         return False
 
 
-def create_event(
-    service,
-    calendar_id: str,
+def _event_body(
     title: str,
     start_datetime: datetime,
     end_datetime: datetime,
     color_id: str,
     description: str = "",
     timezone: str | None = None
-) -> str | None:
-    """Create a calendar event. Returns event ID."""
+) -> dict[str, Any]:
+    """Build the request body for a calendar event."""
     if timezone is None:
         timezone = _get_local_timezone()
 
-    event = {
+    return {
         "summary": title,
         "description": description,
         "start": {
@@ -136,13 +216,41 @@ def create_event(
             "timeZone": timezone,
         },
         "colorId": color_id,
+        # Updating an event deleted out-of-band (still in the calendar's
+        # trash) restores it instead of silently leaving it cancelled
+        "status": "confirmed",
     }
 
-    try:
-        result = service.events().insert(calendarId=calendar_id, body=event).execute()
-        return result.get("id")
-    except HttpError:
-        return None
+
+def build_insert_request(service, calendar_id: str, body: dict[str, Any]):
+    """Build (but do not execute) an events.insert request."""
+    return service.events().insert(calendarId=calendar_id, body=body)
+
+
+def build_update_request(service, calendar_id: str, event_id: str, body: dict[str, Any]):
+    """Build (but do not execute) an events.update request."""
+    return service.events().update(
+        calendarId=calendar_id, eventId=event_id, body=body
+    )
+
+
+def create_event(
+    service,
+    calendar_id: str,
+    title: str,
+    start_datetime: datetime,
+    end_datetime: datetime,
+    color_id: str,
+    description: str = "",
+    timezone: str | None = None
+) -> str | None:
+    """Create a calendar event. Returns event ID, raises HttpError on failure."""
+    body = _event_body(
+        title, start_datetime, end_datetime, color_id, description, timezone
+    )
+
+    result = _execute(build_insert_request(service, calendar_id, body))
+    return result.get("id")
 
 
 def update_event(
@@ -157,27 +265,14 @@ def update_event(
     timezone: str | None = None
 ) -> bool:
     """Update an existing calendar event. Returns True on success."""
-    if timezone is None:
-        timezone = _get_local_timezone()
+    from googleapiclient.errors import HttpError
 
-    event = {
-        "summary": title,
-        "description": description,
-        "start": {
-            "dateTime": start_datetime.isoformat(),
-            "timeZone": timezone,
-        },
-        "end": {
-            "dateTime": end_datetime.isoformat(),
-            "timeZone": timezone,
-        },
-        "colorId": color_id,
-    }
+    body = _event_body(
+        title, start_datetime, end_datetime, color_id, description, timezone
+    )
 
     try:
-        service.events().update(
-            calendarId=calendar_id, eventId=event_id, body=event
-        ).execute()
+        _execute(build_update_request(service, calendar_id, event_id, body))
         return True
     except HttpError as e:
         if e.resp.status == 404:
@@ -186,19 +281,53 @@ def update_event(
 
 
 def delete_event(service, calendar_id: str, event_id: str) -> bool:
-    """Delete a calendar event. Returns True on success."""
+    """Delete a calendar event. Returns False if it was already gone."""
+    from googleapiclient.errors import HttpError
+
     try:
-        service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
+        _execute(service.events().delete(calendarId=calendar_id, eventId=event_id))
         return True
-    except HttpError:
-        return False
+    except HttpError as e:
+        if _is_gone(e):
+            return False
+        raise
+
+
+def _is_retriable(exc: Exception) -> bool:
+    """Check if an API error is transient (rate limit or server error)."""
+    from googleapiclient.errors import HttpError
+
+    return isinstance(exc, HttpError) and exc.resp.status in RETRY_STATUSES
+
+
+def _retry_delay(exc: Exception, attempt: int) -> float:
+    """Seconds to wait before retry number `attempt` (1-based)."""
+    from googleapiclient.errors import HttpError
+
+    retry_after = exc.resp.get("retry-after") if isinstance(exc, HttpError) else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), RETRY_MAX_DELAY)
+
+    # Exponential backoff with jitter
+    return min(RETRY_BASE_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY) + random.random()
+
 
+def _execute(request) -> Any:
+    """Execute an API request, retrying transient errors with backoff."""
+    from googleapiclient.errors import HttpError
 
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            if attempt == RETRY_ATTEMPTS or not _is_retriable(e):
+                raise
+            time.sleep(_retry_delay(e, attempt))
+
+
+@lru_cache(maxsize=1)
 def _get_local_timezone() -> str:
     """Get local timezone string (IANA format like 'America/New_York')."""
-    import os
-    import subprocess
-
     # Try TZ environment variable first
     tz = os.environ.get("TZ")
     if tz and not tz.startswith(":"):
@@ -206,20 +335,15 @@ def _get_local_timezone() -> str:
     if tz and tz.startswith(":"):
         return tz[1:]
 
-    # macOS: read /etc/localtime symlink
+    # macOS and most Linux: /etc/localtime symlinks into zoneinfo
     try:
-        result = subprocess.run(
-            ["readlink", "/etc/localtime"],
-            capture_output=True, text=True
-        )
-        if result.returncode == 0:
-            path = result.stdout.strip()
-            if "zoneinfo/" in path:
-                return path.split("zoneinfo/")[-1]
-    except Exception:
+        path = os.readlink("/etc/localtime")
+        if "zoneinfo/" in path:
+            return path.split("zoneinfo/")[-1]
+    except OSError:
         pass
 
-    # Linux: read /etc/timezone
+    # Debian-style Linux: read /etc/timezone
     try:
         with open("/etc/timezone", "r") as f:
             return f.read().strip()
@@ -230,87 +354,60 @@ def _get_local_timezone() -> str:
 
 
 def _parse_time_for_date(time_str: str, target_date: date) -> datetime:
-    """Parse HH:MM time string to datetime for a specific date."""
-    time_obj = datetime.strptime(time_str, "%H:%M")
+    """Parse HH:MM (or unpadded H:MM) time string to datetime for a specific date."""
+    hours, _, minutes = time_str.partition(":")
     return datetime(
         year=target_date.year,
         month=target_date.month,
         day=target_date.day,
-        hour=time_obj.hour,
-        minute=time_obj.minute
+        hour=int(hours),
+        minute=int(minutes)
     )
 
 
-def sync_day_to_calendar(
-    service,
-    calendar_id: str,
-    day_data: dict[str, Any],
-    model: dict[str, Any],
-    existing_event_ids: dict[str, str] | None = None
-) -> dict[str, str]:
-    """
-    Sync a day's sleep events to Google Calendar.
+@dataclass(slots=True)
+class EventSpec:
+    """A sleep event to sync, identified by its event key (nap_1, ..., night)."""
 
-    Args:
-        service: Google Calendar API service
-        calendar_id: Target calendar ID (use 'primary' for default)
-        day_data: Day record with naps, night_sleep, predictions
-        model: Trained model with night_sleep_duration
-        existing_event_ids: Dict mapping event keys to Google event IDs
+    key: str
+    title: str
+    start: datetime
+    end: datetime
+    color_id: str
+    description: str
 
-    Returns:
-        Dict mapping event keys (nap_1, nap_2, nap_3, night) to Google event IDs
-    """
-    if existing_event_ids is None:
-        existing_event_ids = {}
+    def body(self) -> dict[str, Any]:
+        """Build the Calendar API request body for this event."""
+        return _event_body(
+            self.title, self.start, self.end, self.color_id, self.description
+        )
 
-    event_ids = {}
+
+def _day_event_specs(day_data: dict[str, Any], model: dict[str, Any]) -> list[EventSpec]:
+    """Build the nap and night events for a day's schedule."""
     target_date = date.fromisoformat(day_data["date"])
+    specs = []
 
     # Get schedule data (use predictions if available, else use raw data)
     schedule = day_data.get("predictions") or {}
     naps = schedule.get("naps") or day_data.get("naps", [])
 
-    # Sync naps
+    # Naps
     for i, nap in enumerate(naps, 1):
-        event_key = f"nap_{i}"
-        nap_start = _parse_time_for_date(nap["start"], target_date)
-        nap_end = _parse_time_for_date(nap["end"], target_date)
-
         is_predicted = nap.get("predicted", True)
         status = "Predicted" if is_predicted else "Actual"
         duration_mins = nap.get("duration_minutes", 0)
-        description = f"Duration: {duration_mins} minutes\nStatus: {status}"
 
-        title = f"Baby Nap {i}"
+        specs.append(EventSpec(
+            key=f"nap_{i}",
+            title=f"Baby Nap {i}",
+            start=_parse_time_for_date(nap["start"], target_date),
+            end=_parse_time_for_date(nap["end"], target_date),
+            color_id=COLOR_NAP,
+            description=f"Duration: {duration_mins} minutes\nStatus: {status}"
+        ))
 
-        existing_id = existing_event_ids.get(event_key)
-        if existing_id:
-            # Try to update existing event
-            success = update_event(
-                service, calendar_id, existing_id,
-                title, nap_start, nap_end, COLOR_NAP, description
-            )
-            if success:
-                event_ids[event_key] = existing_id
-            else:
-                # Event was deleted, create new one
-                new_id = create_event(
-                    service, calendar_id,
-                    title, nap_start, nap_end, COLOR_NAP, description
-                )
-                if new_id:
-                    event_ids[event_key] = new_id
-        else:
-            # Create new event
-            new_id = create_event(
-                service, calendar_id,
-                title, nap_start, nap_end, COLOR_NAP, description
-            )
-            if new_id:
-                event_ids[event_key] = new_id
-
-    # Sync night sleep
+    # Night sleep
     night_sleep_time = schedule.get("night_sleep") or day_data.get("night_sleep")
     if night_sleep_time:
         night_start = _parse_time_for_date(night_sleep_time, target_date)
@@ -324,60 +421,234 @@ def sync_day_to_calendar(
         description = f"Duration: {night_duration // 60}h {night_duration % 60}m\nStatus: {status}"
         description += f"\nPredicted wake: {wake_time.strftime('%H:%M')}"
 
-        title = "Baby Night Sleep"
-        event_key = "night"
+        specs.append(EventSpec(
+            key="night",
+            title="Baby Night Sleep",
+            start=night_start,
+            end=wake_time,
+            color_id=COLOR_NIGHT,
+            description=description
+        ))
+
+    return specs
+
 
-        existing_id = existing_event_ids.get(event_key)
-        if existing_id:
-            success = update_event(
-                service, calendar_id, existing_id,
-                title, night_start, wake_time, COLOR_NIGHT, description
+def sync_day_to_calendar(
+    service,
+    calendar_id: str,
+    day_data: dict[str, Any],
+    model: dict[str, Any],
+    existing_event_ids: dict[str, dict[str, str]] | None = None,
+    previous_day: dict[str, Any] | None = None
+) -> dict[str, dict[str, str]]:
+    """
+    Sync a day's sleep events to Google Calendar.
+
+    Args:
+        service: Google Calendar API service
+        calendar_id: Target calendar ID (use 'primary' for default)
+        day_data: Day record with naps, night_sleep, predictions
+        model: Trained model with night_sleep_duration
+        existing_event_ids: Dict mapping event keys to {id, hash} of the
+            previously synced events (bare ID strings are accepted too)
+        previous_day: Yesterday's record; its night event is updated with
+            this day's morning wake in the same batch. On success its
+            night_wake_synced field is set to that wake time.
+
+    Returns:
+        Dict mapping event keys (nap_1, nap_2, nap_3, night) to {id, hash},
+        the Google event ID and a hash of the synced event body.
+        Pass it back as existing_event_ids on the next sync so events are
+        updated in place, unchanged events are skipped and events for keys
+        no longer scheduled are deleted.
+
+    Raises:
+        CalendarSyncError: If creating or updating some of the day's events
+            fails for a reason other than a transient error. It carries
+            the references of the events that did sync.
+    """
+    from googleapiclient.errors import HttpError
+
+    if existing_event_ids is None:
+        existing_event_ids = {}
+
+    event_ids = {}
+
+    # Event bodies keyed by event key (nap_1, nap_2, ..., night)
+    bodies = {spec.key: spec.body() for spec in _day_event_specs(day_data, model)}
+
+    # Update events we already know about, create the rest - all in one batch.
+    # Events whose body hasn't changed since the last sync are skipped.
+    existing = {key: _event_ref(value) for key, value in existing_event_ids.items()}
+    hashes = {event_key: _body_hash(body) for event_key, body in bodies.items()}
+
+    requests = {}
+    for event_key, body in bodies.items():
+        ref = existing.get(event_key)
+        if ref and ref["hash"] == hashes[event_key]:
+            continue
+        elif ref:
+            requests[event_key] = build_update_request(
+                service, calendar_id, ref["id"], body
             )
-            if success:
-                event_ids[event_key] = existing_id
-            else:
-                new_id = create_event(
-                    service, calendar_id,
-                    title, night_start, wake_time, COLOR_NIGHT, description
-                )
-                if new_id:
-                    event_ids[event_key] = new_id
         else:
-            new_id = create_event(
-                service, calendar_id,
-                title, night_start, wake_time, COLOR_NIGHT, description
+            requests[event_key] = build_insert_request(service, calendar_id, body)
+
+    # Events synced earlier that are no longer in the schedule (e.g. fewer
+    # naps after retraining) are removed instead of left behind
+    stale_keys = [event_key for event_key in existing if event_key not in bodies]
+    for event_key in stale_keys:
+        requests[event_key] = service.events().delete(
+            calendarId=calendar_id, eventId=existing[event_key]["id"]
+        )
+
+    previous_night = None
+    if previous_day and day_data.get("morning_wake"):
+        previous_night = _night_wake_update(previous_day, day_data["morning_wake"])
+    if previous_night:
+        event_id, body = previous_night
+        previous_ref = _event_ref(previous_day["calendar_event_ids"]["night"])
+        if previous_ref["hash"] != _body_hash(body):
+            requests[PREVIOUS_NIGHT_KEY] = build_update_request(
+                service, calendar_id, event_id, body
             )
-            if new_id:
-                event_ids[event_key] = new_id
+            previous_day.pop("night_wake_synced", None)
+
+    responses, errors = _execute_batch(service, requests)
+
+    # Deletes and yesterday's night update are best effort, don't fail
+    # today's sync on them. A delete that fails for any reason other than
+    # the event already being gone keeps its reference, so the next sync
+    # tries again.
+    for event_key in stale_keys:
+        exc = errors.pop(event_key, None)
+        if exc is not None and not _is_gone(exc):
+            event_ids[event_key] = existing[event_key]
+    errors.pop(PREVIOUS_NIGHT_KEY, None)
+    if PREVIOUS_NIGHT_KEY in responses:
+        previous_day["calendar_event_ids"]["night"] = {
+            "id": previous_night[0], "hash": _body_hash(previous_night[1])
+        }
+        previous_day["night_wake_synced"] = day_data["morning_wake"]
+
+    # Updates of events deleted from the calendar fall back to a create
+    fallback = {}
+    for event_key, exc in list(errors.items()):
+        if event_key in existing and isinstance(exc, HttpError) and exc.resp.status == 404:
+            fallback[event_key] = build_insert_request(
+                service, calendar_id, bodies[event_key]
+            )
+            del errors[event_key]
+
+    fallback_responses, fallback_errors = _execute_batch(service, fallback)
+    responses.update(fallback_responses)
+    errors.update(fallback_errors)
+
+    for event_key in bodies:
+        if event_key not in requests:
+            event_ids[event_key] = existing[event_key]  # Unchanged
+        elif event_key in responses and responses[event_key].get("id"):
+            event_ids[event_key] = {
+                "id": responses[event_key]["id"], "hash": hashes[event_key]
+            }
+        elif event_key in errors and event_key in existing and event_key not in fallback:
+            # Failed update, the event is still there with its old body
+            event_ids[event_key] = existing[event_key]
+
+    # Report failed creates and updates only after collecting what did
+    # sync, so the caller can save those references
+    if errors:
+        raise CalendarSyncError(event_ids, errors)
 
     return event_ids
 
 
-def update_night_sleep_with_actual_wake(
+def _is_gone(exc: Exception) -> bool:
+    """Check if an API error means the event no longer exists."""
+    from googleapiclient.errors import HttpError
+
+    return isinstance(exc, HttpError) and exc.resp.status in (404, 410)
+
+
+def _event_ref(value: dict[str, str] | str) -> dict[str, str]:
+    """Normalize a stored event reference to {id, hash}.
+
+    Older records store the bare Google event ID; those get an empty hash
+    so the event is re-sent once.
+    """
+    if isinstance(value, str):
+        return {"id": value, "hash": ""}
+    return value
+
+
+def _body_hash(body: dict[str, Any]) -> str:
+    """Short stable hash of an event body, to detect unchanged events."""
+    return hashlib.blake2b(
+        orjson.dumps(body, option=orjson.OPT_SORT_KEYS), digest_size=8
+    ).hexdigest()
+
+
+def _execute_batch(
     service,
-    calendar_id: str,
-    yesterday_data: dict[str, Any],
-    actual_wake_time: str
-) -> bool:
+    requests: dict[str, Any]
+) -> tuple[dict[str, dict[str, Any]], dict[str, Exception]]:
     """
-    Update yesterday's night sleep event with actual wake time.
+    Execute requests as a single batch HTTP call.
+
+    Requests failing with a transient error are re-sent in a new batch
+    with backoff, up to RETRY_ATTEMPTS times.
 
     Args:
         service: Google Calendar API service
-        calendar_id: Target calendar ID
-        yesterday_data: Yesterday's day record
-        actual_wake_time: Today's actual wake time (HH:MM)
+        requests: Dict mapping request IDs to unexecuted API requests
 
     Returns:
-        True if event was updated, False otherwise
+        Tuple of (responses, errors), each keyed by request ID
     """
-    event_id = yesterday_data.get("calendar_event_ids", {}).get("night")
-    if not event_id:
-        return False
+    responses: dict[str, dict[str, Any]] = {}
+    errors: dict[str, Exception] = {}
+
+    def callback(request_id, response, exception):
+        if exception is not None:
+            errors[request_id] = exception
+        else:
+            responses[request_id] = response
+
+    pending = dict(requests)
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        if not pending:
+            break
+
+        batch = service.new_batch_http_request(callback=callback)
+        for request_id, request in pending.items():
+            batch.add(request, request_id=request_id)
+        _execute(batch)
+
+        retriable = [rid for rid in pending if _is_retriable(errors.get(rid))]
+        if not retriable or attempt == RETRY_ATTEMPTS:
+            break
+
+        time.sleep(max(_retry_delay(errors[rid], attempt) for rid in retriable))
+        pending = {rid: pending[rid] for rid in retriable}
+        for rid in retriable:
+            del errors[rid]
+
+    return responses, errors
+
+
+def _night_wake_update(
+    yesterday_data: dict[str, Any],
+    actual_wake_time: str
+) -> tuple[str, dict[str, Any]] | None:
+    """Build (event_id, body) for yesterday's night event ending at actual wake."""
+    night_ref = yesterday_data.get("calendar_event_ids", {}).get("night")
+    if not night_ref:
+        return None
+    event_id = _event_ref(night_ref)["id"]
 
     night_sleep_time = yesterday_data.get("night_sleep")
     if not night_sleep_time:
-        return False
+        return None
 
     yesterday_date = date.fromisoformat(yesterday_data["date"])
     today_date = yesterday_date + timedelta(days=1)
@@ -395,16 +666,52 @@ def update_night_sleep_with_actual_wake(
 
     title = "Baby Night Sleep"
 
-    return update_event(
-        service, calendar_id, event_id,
-        title, night_start, wake_end, COLOR_NIGHT, description
-    )
+    return event_id, _event_body(title, night_start, wake_end, COLOR_NIGHT, description)
+
+
+def update_night_sleep_with_actual_wake(
+    service,
+    calendar_id: str,
+    yesterday_data: dict[str, Any],
+    actual_wake_time: str
+) -> bool:
+    """
+    Update yesterday's night sleep event with actual wake time.
+
+    Args:
+        service: Google Calendar API service
+        calendar_id: Target calendar ID
+        yesterday_data: Yesterday's day record
+        actual_wake_time: Today's actual wake time (HH:MM)
+
+    Returns:
+        True if event was updated, False otherwise
+    """
+    from googleapiclient.errors import HttpError
+
+    night = _night_wake_update(yesterday_data, actual_wake_time)
+    if night is None:
+        return False
+
+    event_id, body = night
+    try:
+        _execute(build_update_request(service, calendar_id, event_id, body))
+    except HttpError as e:
+        if e.resp.status == 404:
+            return False
+        raise
+
+    yesterday_data["calendar_event_ids"]["night"] = {"id": event_id, "hash": _body_hash(body)}
+    yesterday_data["night_wake_synced"] = actual_wake_time
+    return True
 
 
 def list_calendars(service) -> list[dict[str, str]]:
     """List available calendars. Returns list of {id, name} dicts."""
+    from googleapiclient.errors import HttpError
+
     try:
-        result = service.calendarList().list().execute()
+        result = _execute(service.calendarList().list())
         calendars = []
         for cal in result.get("items", []):
             calendars.append({
@@ -10,19 +10,20 @@ from . import data, model, display, calendar
 @click.version_option()
 def cli():
     """Baby Sleep Scheduler - Predict and track baby sleep patterns."""
-    pass
+    # One "today" for the whole command
+    data.current_date.cache_clear()
 
 
 @cli.command()
 def train():
     """Train the model on historical sleep data."""
     sleep_data = data.load_data()
-    historical = data.get_historical_days(sleep_data)
 
-    if not historical:
+    if next(data.iter_days(sleep_data), None) is None:
         display.warning("No historical data found. Using default patterns.")
 
     trained_model = model.train(sleep_data)
+    data.compact(sleep_data)
     display.success(f"Model trained on {trained_model['days_count']} days of data.")
     display.show_model_info(trained_model)
 
@@ -49,7 +50,7 @@ def predict(wake_time: str):
     today = data.get_today(sleep_data)
     today["morning_wake"] = wake_time
     today["predictions"] = schedule
-    data.save_data(sleep_data)
+    data.journal_append("upsert_day", today)
 
     display.show_schedule(schedule)
 
@@ -86,7 +87,7 @@ def correct(target: str, start: str, end: str | None):
         if today.get("predictions"):
             today["predictions"]["night_sleep"] = start
             today["predictions"]["night_predicted"] = False
-        data.save_data(sleep_data)
+        data.journal_append("upsert_day", today)
         display.success(f"Night sleep updated: {start}")
         if today.get("predictions"):
             display.show_schedule(today["predictions"], "Updated Schedule")
@@ -135,7 +136,7 @@ def correct(target: str, start: str, end: str | None):
 
     today["predictions"] = schedule
     today["naps"] = schedule["naps"]
-    data.save_data(sleep_data)
+    data.journal_append("upsert_day", today)
 
     if end:
         display.success(f"Nap {nap_number} updated: {start}-{end}")
@@ -189,8 +190,8 @@ def add(date_str: str):
         return
 
     sleep_data = data.load_data()
-    data.add_day(sleep_data, date_str, morning_wake, naps, night_sleep)
-    data.save_data(sleep_data)
+    day = data.add_day(sleep_data, date_str, morning_wake, naps, night_sleep)
+    data.journal_append("upsert_day", day)
 
     display.success(f"Added sleep data for {date_str}")
 
@@ -220,9 +221,15 @@ def history(days: int):
     DAYS is the number of days to show (default: 7)
     """
     sleep_data = data.load_data()
-    historical = data.get_historical_days(sleep_data, exclude_today=False)
 
-    if not historical:
+    historical = data.get_historical_days(sleep_data, exclude_today=False, limit=days)
+
+    # With days <= 0 an empty result doesn't mean there is no data;
+    # 'history 0' shows an empty table
+    no_data = not historical and (
+        days > 0 or next(data.iter_days(sleep_data, exclude_today=False), None) is None
+    )
+    if no_data:
         display.warning("No historical data found.")
         display.info("Use 'baby-sleep add <date>' to add historical data.")
         return
@@ -282,41 +289,47 @@ def sync(setup: bool, calendar_id: str):
     # Get existing event IDs
     existing_ids = today.get("calendar_event_ids", {})
 
+    # Yesterday's night sleep gets today's actual wake time in the same sync
+    yesterday = data.get_yesterday(sleep_data)
+
     # Sync to calendar
     display.info(f"Syncing to calendar: {calendar_id}")
+    sync_error = None
     try:
         event_ids = calendar.sync_day_to_calendar(
             service,
             calendar_id,
             today,
             trained_model,
-            existing_ids
+            existing_ids,
+            previous_day=yesterday
         )
+    except calendar.CalendarSyncError as e:
+        # Still save the events that did sync, or they'd be created again
+        event_ids, sync_error = e.event_ids, e
     except Exception as e:
         display.error(f"Failed to sync: {e}")
         return
 
     # Save updated event IDs
     today["calendar_event_ids"] = event_ids
-    data.save_data(sleep_data)
+    data.journal_append("upsert_day", today)
+    if yesterday:
+        data.journal_append("upsert_day", yesterday)
 
-    # Update yesterday's night sleep with actual wake time
-    yesterday = data.get_yesterday(sleep_data)
-    yesterday_updated = False
-    if yesterday and yesterday.get("night_sleep") and yesterday.get("calendar_event_ids", {}).get("night"):
-        try:
-            yesterday_updated = calendar.update_night_sleep_with_actual_wake(
-                service,
-                calendar_id,
-                yesterday,
-                today["morning_wake"]
-            )
-        except Exception:
-            pass  # Don't fail sync if yesterday update fails
+    if sync_error:
+        display.error(f"Failed to sync: {sync_error}")
+        return
+
+    yesterday_updated = bool(yesterday) and \
+        yesterday.get("night_wake_synced") == today["morning_wake"]
 
     # Report results
-    naps_synced = sum(1 for k in event_ids if k.startswith("nap_"))
-    night_synced = "night" in event_ids
+    # event_ids can still hold stale events whose delete failed, so only
+    # count the events in today's schedule
+    scheduled_naps = today["predictions"].get("naps") or today.get("naps", [])
+    naps_synced = sum(1 for i in range(1, len(scheduled_naps) + 1) if f"nap_{i}" in event_ids)
+    night_synced = bool(today["predictions"].get("night_sleep")) and "night" in event_ids
 
     display.success("Calendar sync complete!")
     if yesterday_updated:
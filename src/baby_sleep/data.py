@@ -1,12 +1,29 @@
 """Data loading and saving for baby sleep records."""
 
-import json
-from datetime import date, datetime, timedelta
+import bisect
+import os
+import re
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+import numpy as np
+import orjson
 
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 DATA_FILE = DATA_DIR / "sleep_data.json"
+JOURNAL_FILE = DATA_DIR / "sleep_data.log"
+
+# Journal entries replayed on load before it is folded into DATA_FILE
+JOURNAL_MAX_ENTRIES = 200
+
+_TIME_RE = re.compile(r"([01]\d|2[0-3]):[0-5]\d")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# HH:MM string for every minute of the day, indexed by minutes since midnight
+_MINUTE_TO_HHMM = [f"{h:02d}:{m:02d}" for h in range(24) for m in range(60)]
 
 
 def get_default_data() -> dict[str, Any]:
@@ -21,46 +38,145 @@ def get_default_data() -> dict[str, Any]:
 
 
 def load_data() -> dict[str, Any]:
-    """Load sleep data from JSON file."""
+    """Load sleep data from JSON file, replaying any journaled changes."""
     if not DATA_FILE.exists():
-        return get_default_data()
+        data = get_default_data()
+    else:
+        data = orjson.loads(DATA_FILE.read_bytes())
+
+    _days_index(data)
+    entries = _read_journal()
+    for entry in entries:
+        if entry.get("op") == "upsert_day":
+            _put_day(data, entry["day"])
 
-    with open(DATA_FILE, "r") as f:
-        return json.load(f)
+    # Keep replay cheap for users who rarely run 'train'
+    if len(entries) > JOURNAL_MAX_ENTRIES:
+        save_data(data)
+
+    return data
 
 
 def save_data(data: dict[str, Any]) -> None:
-    """Save sleep data to JSON file."""
+    """Save full sleep data to JSON file. Clears the journal."""
+    # In-memory helpers (underscore keys) are not persisted
+    serializable = {k: v for k, v in data.items() if not k.startswith("_")}
+
+    # Write to a temp file and rename so a crash never leaves a torn file
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_file = DATA_FILE.with_suffix(".json.tmp")
+    tmp_file.write_bytes(orjson.dumps(serializable, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, DATA_FILE)
+
+    # Everything journaled so far is now part of the JSON file
+    JOURNAL_FILE.unlink(missing_ok=True)
+
+
+def journal_append(op: str, day: dict[str, Any]) -> None:
+    """
+    Record a day change in the journal instead of rewriting the JSON file.
+
+    Journaled changes are replayed by load_data and folded into
+    sleep_data.json by save_data/compact.
+    """
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    with open(DATA_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    with open(JOURNAL_FILE, "ab") as f:
+        f.write(orjson.dumps({"op": op, "day": day}) + b"\n")
+
+
+def compact(data: dict[str, Any]) -> None:
+    """Fold the journal into sleep_data.json if there is anything to fold."""
+    if JOURNAL_FILE.exists():
+        save_data(data)
+
+
+def _read_journal() -> list[dict[str, Any]]:
+    """
+    Read journal entries, repairing a torn trailing line.
+
+    A crash mid-append can leave a last line without its newline. It is
+    cut off (or terminated, if it is complete) so the next journal_append
+    starts on a fresh line. Any other unreadable line is an error.
+    """
+    if not JOURNAL_FILE.exists():
+        return []
+
+    raw = JOURNAL_FILE.read_bytes()
+    lines = raw.split(b"\n")
+    tail = lines.pop()  # Empty when the file ends with a newline
+    entries = [orjson.loads(line) for line in lines if line]
+
+    if tail:
+        try:
+            entries.append(orjson.loads(tail))
+        except orjson.JSONDecodeError:
+            os.truncate(JOURNAL_FILE, len(raw) - len(tail))
+        else:
+            with open(JOURNAL_FILE, "ab") as f:
+                f.write(b"\n")
+    return entries
+
+
+def _days_index(data: dict[str, Any]) -> dict[str, dict[str, Any]]:
+    """
+    Get the date -> day record index, building it on first use.
+
+    Day records must be added through _put_day so the index and the
+    date-sorted data["days"] list stay in sync.
+    """
+    index = data.get("_days_by_date")
+    if index is None:
+        data["days"].sort(key=lambda d: d["date"])
+        index = {day["date"]: day for day in data["days"]}
+        data["_days_by_date"] = index
+    return index
+
+
+def _put_day(data: dict[str, Any], day: dict[str, Any]) -> None:
+    """Insert or replace a day record, keeping data["days"] sorted by date."""
+    index = _days_index(data)
+    days = data["days"]
+    date_str = day["date"]
+
+    pos = bisect.bisect_left(days, date_str, key=lambda d: d["date"])
+    if date_str in index:
+        days[pos] = day
+    else:
+        days.insert(pos, day)
+    index[date_str] = day
 
 
 def validate_time(time_str: str) -> bool:
     """Validate time string in HH:MM format."""
-    try:
-        datetime.strptime(time_str, "%H:%M")
-        return True
-    except ValueError:
-        return False
+    return _TIME_RE.fullmatch(time_str) is not None
 
 
 def validate_date(date_str: str) -> bool:
     """Validate date string in YYYY-MM-DD format."""
+    if _DATE_RE.fullmatch(date_str) is None:
+        return False
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        date.fromisoformat(date_str)
         return True
     except ValueError:
         return False
 
 
+@lru_cache(maxsize=1)
+def current_date() -> date:
+    """
+    Today's date, captured once per process.
+
+    The CLI clears the cache at the start of each command so the whole
+    command sees one date, even if it runs across midnight.
+    """
+    return date.today()
+
+
 def parse_time(time_str: str) -> datetime:
     """Parse time string to datetime object (today's date)."""
-    return datetime.strptime(time_str, "%H:%M").replace(
-        year=date.today().year,
-        month=date.today().month,
-        day=date.today().day
-    )
+    hours, _, minutes = time_str.partition(":")
+    return datetime.combine(current_date(), time(int(hours), int(minutes)))
 
 
 def format_time(dt: datetime) -> str:
@@ -68,17 +184,30 @@ def format_time(dt: datetime) -> str:
     return dt.strftime("%H:%M")
 
 
+def time_to_minutes(time_str: str) -> int:
+    """
+    Convert HH:MM time string to minutes since midnight.
+
+    Splits on the colon rather than slicing: older data files can hold
+    unpadded times like "7:15".
+    """
+    hours, _, minutes = time_str.partition(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def format_minute(minute: int) -> str:
+    """Format minutes since midnight to HH:MM string, wrapping past midnight."""
+    return _MINUTE_TO_HHMM[minute % 1440]
+
+
 def get_day(data: dict[str, Any], date_str: str) -> dict[str, Any] | None:
     """Get day record by date string."""
-    for day in data["days"]:
-        if day["date"] == date_str:
-            return day
-    return None
+    return _days_index(data).get(date_str)
 
 
 def get_today(data: dict[str, Any]) -> dict[str, Any]:
     """Get or create today's record."""
-    today_str = date.today().isoformat()
+    today_str = current_date().isoformat()
     day = get_day(data, today_str)
 
     if day is None:
@@ -91,7 +220,7 @@ def get_today(data: dict[str, Any]) -> dict[str, Any]:
             "predictions": None,
             "calendar_event_ids": {}
         }
-        data["days"].append(day)
+        _put_day(data, day)
 
     # Ensure calendar_event_ids exists for older records
     if "calendar_event_ids" not in day:
@@ -120,18 +249,14 @@ def add_day(
         "calendar_event_ids": existing.get("calendar_event_ids", {}) if existing else {}
     }
 
-    if existing:
-        data["days"].remove(existing)
-
-    data["days"].append(day)
-    data["days"].sort(key=lambda d: d["date"])
+    _put_day(data, day)
 
     return day
 
 
 def get_yesterday(data: dict[str, Any]) -> dict[str, Any] | None:
     """Get yesterday's record if it exists."""
-    yesterday_str = (date.today() - timedelta(days=1)).isoformat()
+    yesterday_str = (current_date() - timedelta(days=1)).isoformat()
     day = get_day(data, yesterday_str)
 
     # Ensure calendar_event_ids exists for older records
@@ -141,15 +266,77 @@ def get_yesterday(data: dict[str, Any]) -> dict[str, Any] | None:
     return day
 
 
-def get_historical_days(data: dict[str, Any], exclude_today: bool = True) -> list[dict[str, Any]]:
-    """Get completed historical days for training."""
-    today_str = date.today().isoformat()
-    days = []
-
-    for day in data["days"]:
+def iter_days(
+    data: dict[str, Any],
+    exclude_today: bool = True,
+    newest_first: bool = False
+) -> Iterator[dict[str, Any]]:
+    """Iterate completed historical days in date order (or newest first)."""
+    today_str = current_date().isoformat()
+
+    _days_index(data)  # Ensures data["days"] is sorted
+    days = reversed(data["days"]) if newest_first else data["days"]
+    for day in days:
         if exclude_today and day["date"] == today_str:
             continue
         if day.get("morning_wake") and day.get("naps") and day.get("night_sleep"):
-            days.append(day)
+            yield day
+
+
+def get_historical_days(
+    data: dict[str, Any],
+    exclude_today: bool = True,
+    limit: int | None = None
+) -> list[dict[str, Any]]:
+    """
+    Get completed historical days for training, oldest first.
+
+    With limit, only the `limit` most recent days are returned (still
+    oldest first). Only those days are visited, from the newest back.
+    """
+    if limit is None:
+        return list(iter_days(data, exclude_today))
+
+    recent = list(islice(iter_days(data, exclude_today, newest_first=True), max(limit, 0)))
+    recent.reverse()
+    return recent
+
+
+def days_to_arrays(days: list[dict[str, Any]]) -> dict[str, np.ndarray]:
+    """
+    Project day records to NumPy arrays of minutes since midnight.
+
+    Returns:
+        Dict with "morning_wake" and "night_sleep" of shape (n_days,),
+        "nap_starts" and "nap_ends" of shape (n_days, max_naps) padded
+        with -1, "nap_counts" of shape (n_days,) and "date_ordinals"
+        (date.toordinal() of each day) of shape (n_days,)
+    """
+    max_naps = max((len(day["naps"]) for day in days), default=0)
+
+    date_ordinals = np.empty(len(days), dtype=np.int32)
+    nap_counts = np.empty(len(days), dtype=np.int16)
+    morning_wake = np.full(len(days), -1, dtype=np.int16)
+    night_sleep = np.full(len(days), -1, dtype=np.int16)
+    nap_starts = np.full((len(days), max_naps), -1, dtype=np.int16)
+    nap_ends = np.full((len(days), max_naps), -1, dtype=np.int16)
+
+    for d, day in enumerate(days):
+        date_ordinals[d] = date.fromisoformat(day["date"]).toordinal()
+        nap_counts[d] = len(day["naps"])
+        if day.get("morning_wake"):
+            morning_wake[d] = time_to_minutes(day["morning_wake"])
+        if day.get("night_sleep"):
+            night_sleep[d] = time_to_minutes(day["night_sleep"])
+        for i, nap in enumerate(day["naps"]):
+            nap_starts[d, i] = time_to_minutes(nap["start"])
+            nap_ends[d, i] = time_to_minutes(nap["end"])
 
-    return days
+    return {
+        "morning_wake": morning_wake,
+        "night_sleep": night_sleep,
+        "nap_starts": nap_starts,
+        "nap_ends": nap_ends,
+        "nap_counts": nap_counts,
+        "date_ordinals": date_ordinals,
+    }
@@ -1,5 +1,7 @@
 """Rich terminal output formatting."""
 
+import sys
+
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -8,6 +10,18 @@ from typing import Any
 
 console = Console()
 
+# Styled status cells, built once instead of parsing markup for every row
+_STATUS_PREDICTED = Text("Predicted", style="yellow")
+_STATUS_ACTUAL = Text("Actual", style="green")
+
+# Plain-text layouts used when output is not a terminal (pipes, scripts)
+_SCHEDULE_ROW = "{event:<6}  {start:<5}  {end:<5}  {duration:<8}  {status}\n"
+_SCHEDULE_HEADER = _SCHEDULE_ROW.format(
+    event="Event", start="Start", end="End", duration="Duration", status="Status"
+)
+_HISTORY_ROW = "{date:<10}  {wake:<5}  {naps:<40}  {night}\n"
+_HISTORY_HEADER = _HISTORY_ROW.format(date="Date", wake="Wake", naps="Naps", night="Night")
+
 
 def format_duration(minutes: int) -> str:
     """Format minutes as Xh Ym string."""
@@ -23,6 +37,10 @@ def format_duration(minutes: int) -> str:
 
 def show_schedule(schedule: dict[str, Any], title: str = "Predicted Schedule for Today") -> None:
     """Display schedule as a Rich table."""
+    if not console.is_terminal:
+        _write_schedule_plain(schedule, title)
+        return
+
     table = Table(title=f"[bold cyan]{title}[/bold cyan]", show_header=True)
 
     table.add_column("Event", style="bold")
@@ -36,11 +54,11 @@ def show_schedule(schedule: dict[str, Any], title: str = "Predicted Schedule for
         schedule["wake_time"],
         "-",
         "-",
-        "[green]Actual[/green]"
+        _STATUS_ACTUAL
     )
 
     for i, nap in enumerate(schedule["naps"], 1):
-        status = "[yellow]Predicted[/yellow]" if nap.get("predicted", True) else "[green]Actual[/green]"
+        status = _STATUS_PREDICTED if nap.get("predicted", True) else _STATUS_ACTUAL
         table.add_row(
             f"Nap {i}",
             nap["start"],
@@ -49,7 +67,7 @@ def show_schedule(schedule: dict[str, Any], title: str = "Predicted Schedule for
             status
         )
 
-    night_status = "[yellow]Predicted[/yellow]" if schedule.get("night_predicted", True) else "[green]Actual[/green]"
+    night_status = _STATUS_PREDICTED if schedule.get("night_predicted", True) else _STATUS_ACTUAL
     table.add_row(
         "Night",
         schedule["night_sleep"],
@@ -64,13 +82,13 @@ def show_schedule(schedule: dict[str, Any], title: str = "Predicted Schedule for
 
 
 def show_history(days: list[dict[str, Any]], limit: int = 7) -> None:
-    """Display history of recent days."""
-    if not days:
-        console.print("[yellow]No historical data found.[/yellow]")
-        return
-
+    """Display history of recent days. Callers handle the no-data case."""
     recent = sorted(days, key=lambda d: d["date"], reverse=True)[:limit]
 
+    if not console.is_terminal:
+        _write_history_plain(recent)
+        return
+
     table = Table(title="[bold cyan]Sleep History[/bold cyan]", show_header=True)
 
     table.add_column("Date", style="bold")
@@ -98,6 +116,46 @@ def show_history(days: list[dict[str, Any]], limit: int = 7) -> None:
     console.print()
 
 
+def _write_schedule_plain(schedule: dict[str, Any], title: str) -> None:
+    """Write schedule as plain text, bypassing Rich rendering."""
+    rows = [_SCHEDULE_ROW.format(
+        event="Wake", start=schedule["wake_time"], end="-", duration="-", status="Actual"
+    )]
+    for i, nap in enumerate(schedule["naps"], 1):
+        rows.append(_SCHEDULE_ROW.format(
+            event=f"Nap {i}",
+            start=nap["start"],
+            end=nap["end"],
+            duration=format_duration(nap["duration_minutes"]),
+            status="Predicted" if nap.get("predicted", True) else "Actual"
+        ))
+    rows.append(_SCHEDULE_ROW.format(
+        event="Night",
+        start=schedule["night_sleep"],
+        end="-",
+        duration="-",
+        status="Predicted" if schedule.get("night_predicted", True) else "Actual"
+    ))
+
+    sys.stdout.write(f"{title}\n")
+    sys.stdout.write(_SCHEDULE_HEADER)
+    sys.stdout.writelines(rows)
+
+
+def _write_history_plain(recent: list[dict[str, Any]]) -> None:
+    """Write history rows as plain text, bypassing Rich rendering."""
+    sys.stdout.write(_HISTORY_HEADER)
+    sys.stdout.writelines(
+        _HISTORY_ROW.format(
+            date=day["date"],
+            wake=day.get("morning_wake") or "-",
+            naps=", ".join(f"{n['start']}-{n['end']}" for n in day.get("naps") or []) or "-",
+            night=day.get("night_sleep") or "-"
+        )
+        for day in recent
+    )
+
+
 def show_model_info(model: dict[str, Any]) -> None:
     """Display model information."""
     text = Text()
@@ -108,11 +166,13 @@ def show_model_info(model: dict[str, Any]) -> None:
 
     text.append("Wake Windows: ", style="bold")
     windows = model.get("wake_windows", [])
-    text.append(", ".join(f"{w}min" for w in windows) + "\n")
+    text.append(", ".join(f"{w}min" for w in windows))
+    text.append("\n")
 
     text.append("Nap Durations: ", style="bold")
     durations = model.get("nap_durations", [])
-    text.append(", ".join(f"{d}min" for d in durations) + "\n")
+    text.append(", ".join(f"{d}min" for d in durations))
+    text.append("\n")
 
     text.append("Night Window: ", style="bold")
     text.append(f"{model.get('night_sleep_window', 'N/A')}min\n")
@@ -1,140 +1,170 @@
 """Pattern-based sleep prediction model."""
 
-import json
-from datetime import date, datetime, timedelta
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import numpy as np
+import orjson
 
-from .data import get_historical_days, parse_time, format_time
+from .data import (
+    current_date, days_to_arrays, get_historical_days, format_minute,
+    time_to_minutes
+)
 
 MODEL_DIR = Path(__file__).parent.parent.parent / "models"
 MODEL_FILE = MODEL_DIR / "model.json"
 
+# Last loaded/saved model and the model file mtime it corresponds to
+_model_cache: dict[str, Any] | None = None
+_model_mtime: int | None = None
+_model_dir_ready = False
+
+# Predictions are cached by wake time plus the model parameters they use,
+# so a retrained model never hits stale entries
+PREDICT_CACHE_SIZE = 256
+
+
+# Typical baby patterns, used until there is data to train on
+_DEFAULT_MODEL_TEMPLATE: dict[str, Any] = {
+    "wake_windows": [150, 165, 180],
+    "nap_durations": [75, 90, 45],
+    "typical_naps_count": 3,
+    "night_sleep_window": 120,
+    "night_sleep_duration": 660,  # 11 hours default
+    "trained_on": None,
+    "days_count": 0
+}
+
 
 def get_default_model() -> dict[str, Any]:
     """Return default model with typical baby patterns."""
-    return {
-        "wake_windows": [150, 165, 180],
-        "nap_durations": [75, 90, 45],
-        "typical_naps_count": 3,
-        "night_sleep_window": 120,
-        "night_sleep_duration": 660,  # 11 hours default
-        "trained_on": None,
-        "days_count": 0
-    }
+    return _copy_model(_DEFAULT_MODEL_TEMPLATE)
+
+
+def _copy_model(model: dict[str, Any]) -> dict[str, Any]:
+    """Copy a model dict and its lists, so the copy can be modified freely."""
+    return dict(
+        model,
+        wake_windows=list(model["wake_windows"]),
+        nap_durations=list(model["nap_durations"])
+    )
 
 
 def load_model() -> dict[str, Any]:
-    """Load trained model from JSON file."""
-    if not MODEL_FILE.exists():
+    """
+    Load trained model from JSON file, reusing the cached copy if unchanged.
+
+    Every call returns its own copy, callers are free to modify it.
+    """
+    global _model_cache, _model_mtime
+
+    try:
+        mtime = os.stat(MODEL_FILE).st_mtime_ns
+    except FileNotFoundError:
+        clear_model_cache()
         return get_default_model()
 
-    with open(MODEL_FILE, "r") as f:
-        return json.load(f)
+    if _model_cache is None or mtime != _model_mtime:
+        with open(MODEL_FILE, "rb") as f:
+            _model_cache = orjson.loads(f.read())
+        _model_mtime = mtime
+    return _copy_model(_model_cache)
 
 
 def save_model(model: dict[str, Any]) -> None:
-    """Save model to JSON file."""
-    MODEL_DIR.mkdir(parents=True, exist_ok=True)
-    with open(MODEL_FILE, "w") as f:
-        json.dump(model, f, indent=2)
+    """Save model to JSON file. Skips the write if the file is unchanged."""
+    global _model_cache, _model_mtime, _model_dir_ready
+
+    content = orjson.dumps(model, option=orjson.OPT_INDENT_2)
+
+    try:
+        with open(MODEL_FILE, "rb") as f:
+            unchanged = f.read() == content
+    except FileNotFoundError:
+        unchanged = False
+
+    if not unchanged:
+        if not _model_dir_ready:
+            MODEL_DIR.mkdir(parents=True, exist_ok=True)
+            _model_dir_ready = True
+        with open(MODEL_FILE, "wb") as f:
+            f.write(content)
+
+    _model_cache = _copy_model(model)
+    _model_mtime = os.stat(MODEL_FILE).st_mtime_ns
+
+
+def _schedule_params(
+    model: dict[str, Any]
+) -> tuple[tuple[int, ...], tuple[int, ...], int, int]:
+    """
+    Wake windows, nap durations, nap count and night window of a model.
+
+    Built fresh on each call, so edits to the model's lists always show up
+    in predictions. The tuples are the keys of the prediction caches.
+    """
+    return (
+        tuple(model["wake_windows"]),
+        tuple(model["nap_durations"]),
+        model["typical_naps_count"],
+        model["night_sleep_window"]
+    )
+
+
+def clear_model_cache() -> None:
+    """Forget the cached model so the next load_model reads the file."""
+    global _model_cache, _model_mtime
+    _model_cache = None
+    _model_mtime = None
 
 
 def time_diff_minutes(start: str, end: str) -> int:
     """Calculate minutes between two time strings."""
-    t1 = datetime.strptime(start, "%H:%M")
-    t2 = datetime.strptime(end, "%H:%M")
-    diff = (t2 - t1).total_seconds() / 60
-    return int(diff)
+    return time_to_minutes(end) - time_to_minutes(start)
 
 
 def train(data: dict[str, Any]) -> dict[str, Any]:
     """Train model on historical data."""
+    # Oldest first, as needed for consecutive day analysis
     days = get_historical_days(data)
 
     if not days:
         model = get_default_model()
-        model["trained_on"] = date.today().isoformat()
+        model["trained_on"] = current_date().isoformat()
         save_model(model)
         return model
 
-    wake_windows_by_nap: dict[int, list[int]] = {}
-    nap_durations_by_nap: dict[int, list[int]] = {}
-    night_windows: list[int] = []
-    night_durations: list[int] = []
-    nap_counts: list[int] = []
-
-    # Sort days by date for consecutive day analysis
-    sorted_days = sorted(days, key=lambda d: d["date"])
-
-    for day in sorted_days:
-        naps = day["naps"]
-        if not naps:
-            continue
-
-        nap_counts.append(len(naps))
-        prev_wake = day["morning_wake"]
-
-        for i, nap in enumerate(naps):
-            wake_window = time_diff_minutes(prev_wake, nap["start"])
-            if i not in wake_windows_by_nap:
-                wake_windows_by_nap[i] = []
-            wake_windows_by_nap[i].append(wake_window)
-
-            duration = time_diff_minutes(nap["start"], nap["end"])
-            if i not in nap_durations_by_nap:
-                nap_durations_by_nap[i] = []
-            nap_durations_by_nap[i].append(duration)
-
-            prev_wake = nap["end"]
-
-        if day.get("night_sleep"):
-            last_nap_end = naps[-1]["end"]
-            night_window = time_diff_minutes(last_nap_end, day["night_sleep"])
-            night_windows.append(night_window)
-
-    # Calculate night sleep duration from consecutive days
-    days_by_date = {d["date"]: d for d in sorted_days}
-    for day in sorted_days:
-        if not day.get("night_sleep"):
-            continue
-
-        # Find next day
-        current_date = date.fromisoformat(day["date"])
-        next_date = (current_date + timedelta(days=1)).isoformat()
-
-        if next_date in days_by_date:
-            next_day = days_by_date[next_date]
-            if next_day.get("morning_wake"):
-                # Calculate duration from night_sleep to next morning_wake
-                # Night sleep is in the evening, wake is next morning
-                night_time = datetime.strptime(day["night_sleep"], "%H:%M")
-                wake_time = datetime.strptime(next_day["morning_wake"], "%H:%M")
-
-                # Add 24 hours to wake time since it's the next day
-                duration = (24 * 60 - night_time.hour * 60 - night_time.minute) + \
-                           (wake_time.hour * 60 + wake_time.minute)
-                night_durations.append(duration)
-
-    typical_naps = int(np.median(nap_counts)) if nap_counts else 3
-    wake_windows = []
-    nap_durations = []
-
-    for i in range(typical_naps):
-        if i in wake_windows_by_nap and wake_windows_by_nap[i]:
-            wake_windows.append(int(np.mean(wake_windows_by_nap[i])))
-        else:
-            wake_windows.append(150 + i * 15)
-
-        if i in nap_durations_by_nap and nap_durations_by_nap[i]:
-            nap_durations.append(int(np.mean(nap_durations_by_nap[i])))
-        else:
-            nap_durations.append(75 if i == 0 else 90 if i == 1 else 45)
-
-    night_sleep_window = int(np.mean(night_windows)) if night_windows else 120
-    night_sleep_duration = int(np.mean(night_durations)) if night_durations else 660
+    # Minutes since midnight; historical days always have at least one nap
+    arrays = days_to_arrays(days)
+    nap_starts = arrays["nap_starts"]
+    nap_ends = arrays["nap_ends"]
+    nap_counts = arrays["nap_counts"]
+
+    # Wake window before nap i runs from the previous nap end (or morning wake)
+    prev_wakes = np.concatenate(
+        [arrays["morning_wake"][:, None], nap_ends[:, :-1]], axis=1
+    )
+    has_nap = np.arange(nap_starts.shape[1]) < nap_counts[:, None]
+    wake_windows, nap_durations, typical_naps = _aggregate(
+        nap_starts - prev_wakes, nap_ends - nap_starts, nap_counts, has_nap
+    )
+
+    last_nap_ends = nap_ends[np.arange(len(days)), nap_counts - 1]
+    has_night = arrays["night_sleep"] >= 0
+    night_windows = (arrays["night_sleep"] - last_nap_ends)[has_night]
+
+    # Night sleep runs from the evening of day i to the morning wake of
+    # day i + 1. Dates are sorted and unique, so day i + 1 is the next
+    # calendar day iff the ordinal difference is 1.
+    night_starts = arrays["night_sleep"][:-1]
+    next_wakes = arrays["morning_wake"][1:]
+    is_night = (np.diff(arrays["date_ordinals"]) == 1) & (night_starts >= 0) & (next_wakes >= 0)
+    night_durations = ((24 * 60 - night_starts) + next_wakes)[is_night]
+
+    night_sleep_window = int(np.mean(night_windows)) if len(night_windows) else 120
+    night_sleep_duration = int(np.mean(night_durations)) if len(night_durations) else 660
 
     model = {
         "wake_windows": wake_windows,
@@ -142,7 +172,7 @@ def train(data: dict[str, Any]) -> dict[str, Any]:
         "typical_naps_count": typical_naps,
         "night_sleep_window": night_sleep_window,
         "night_sleep_duration": night_sleep_duration,
-        "trained_on": date.today().isoformat(),
+        "trained_on": current_date().isoformat(),
         "days_count": len(days)
     }
 
@@ -150,40 +180,148 @@ def train(data: dict[str, Any]) -> dict[str, Any]:
     return model
 
 
+def _aggregate(
+    wake_arr: np.ndarray,
+    dur_arr: np.ndarray,
+    nap_counts: np.ndarray,
+    mask: np.ndarray
+) -> tuple[list[int], list[int], int]:
+    """Per nap slot mean wake window and duration, plus the median nap count.
+
+    Arrays are (days, nap slots), mask marks the slots each day actually has.
+    Only the first median-count slots are averaged. Each of them has at least
+    one sample, since the median never exceeds the longest day.
+    """
+    typical_naps = _median_int(nap_counts)
+    mask = mask[:, :typical_naps]
+    counts = mask.sum(axis=0)
+
+    wake_sums = np.where(mask, wake_arr[:, :typical_naps], 0).sum(axis=0, dtype=np.int64)
+    dur_sums = np.where(mask, dur_arr[:, :typical_naps], 0).sum(axis=0, dtype=np.int64)
+
+    return (
+        (wake_sums / counts).astype(int).tolist(),
+        (dur_sums / counts).astype(int).tolist(),
+        typical_naps
+    )
+
+
+def _median_int(values: np.ndarray) -> int:
+    """Median of non-negative ints, rounded down like int(np.median(values)).
+
+    Skips np.median's dispatch overhead: short inputs are sorted in pure
+    Python, longer ones partitioned around the middle.
+    """
+    n = len(values)
+    lo, hi = (n - 1) // 2, n // 2
+    if n < 32:
+        ordered = sorted(values.tolist())
+    else:
+        ordered = np.partition(values, [lo, hi]).tolist()
+    return (ordered[lo] + ordered[hi]) // 2
+
+
 def predict(wake_time: str, model: dict[str, Any] | None = None) -> dict[str, Any]:
     """Predict full day schedule from morning wake time."""
     if model is None:
         model = load_model()
 
-    schedule = {
+    naps, night_sleep = _predict_naps(wake_time, *_schedule_params(model))
+
+    # Fresh dicts per call, callers are free to modify the schedule
+    return {
         "wake_time": wake_time,
-        "naps": [],
-        "night_sleep": None,
+        "naps": [
+            {"start": start, "end": end, "duration_minutes": duration, "predicted": True}
+            for start, end, duration in naps
+        ],
+        "night_sleep": night_sleep,
         "night_predicted": True
     }
 
-    current_time = parse_time(wake_time)
-
-    for i in range(model["typical_naps_count"]):
-        wake_window = model["wake_windows"][i] if i < len(model["wake_windows"]) else 180
-        nap_duration = model["nap_durations"][i] if i < len(model["nap_durations"]) else 60
-
-        nap_start = current_time + timedelta(minutes=wake_window)
-        nap_end = nap_start + timedelta(minutes=nap_duration)
 
-        schedule["naps"].append({
-            "start": format_time(nap_start),
-            "end": format_time(nap_end),
-            "duration_minutes": nap_duration,
-            "predicted": True
-        })
-
-        current_time = nap_end
-
-    night_time = current_time + timedelta(minutes=model["night_sleep_window"])
-    schedule["night_sleep"] = format_time(night_time)
+def predict_many(
+    wake_times: list[str], model: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """Predict a day schedule for each morning wake time, like predict."""
+    if model is None:
+        model = load_model()
 
-    return schedule
+    params = _schedule_params(model)
+    naps_count = params[2]
+    intervals = _schedule_intervals(*params)
+    durations = intervals[1::2].tolist()
+
+    # One row per wake time: every nap start, nap end and the night sleep
+    wake_mins = np.fromiter(
+        (time_to_minutes(w) for w in wake_times), dtype=np.int32, count=len(wake_times)
+    )
+    offsets = wake_mins[:, None] + np.cumsum(intervals)
+    times = [[format_minute(m) for m in row] for row in offsets.tolist()]
+
+    return [
+        {
+            "wake_time": wake_time,
+            "naps": [
+                {
+                    "start": row[2 * i],
+                    "end": row[2 * i + 1],
+                    "duration_minutes": durations[i],
+                    "predicted": True
+                }
+                for i in range(naps_count)
+            ],
+            "night_sleep": row[-1],
+            "night_predicted": True
+        }
+        for wake_time, row in zip(wake_times, times)
+    ]
+
+
+@lru_cache(maxsize=PREDICT_CACHE_SIZE)
+def _predict_naps(
+    wake_time: str,
+    wake_windows: tuple[int, ...],
+    nap_durations: tuple[int, ...],
+    naps_count: int,
+    night_sleep_window: int
+) -> tuple[tuple[tuple[str, str, int], ...], str]:
+    """Cached core of predict. Returns ((start, end, duration), ...) and night sleep."""
+    intervals = _schedule_intervals(
+        wake_windows, nap_durations, naps_count, night_sleep_window
+    )
+    # Every nap start, nap end and the night sleep in one pass
+    times = [
+        format_minute(m)
+        for m in (time_to_minutes(wake_time) + np.cumsum(intervals)).tolist()
+    ]
+    durations = intervals[1::2].tolist()
+
+    naps = tuple(
+        (times[2 * i], times[2 * i + 1], durations[i]) for i in range(naps_count)
+    )
+    return naps, times[-1]
+
+
+@lru_cache(maxsize=PREDICT_CACHE_SIZE)
+def _schedule_intervals(
+    wake_windows: tuple[int, ...],
+    nap_durations: tuple[int, ...],
+    naps_count: int,
+    night_sleep_window: int
+) -> np.ndarray:
+    """Interleave wake windows and nap durations, then the night window.
+
+    Naps past the learned ones fall back to a 180 minute wake window and a
+    60 minute nap. The result is read-only since it is shared via the cache.
+    """
+    intervals = np.empty(2 * naps_count + 1, dtype=np.int32)
+    for i in range(naps_count):
+        intervals[2 * i] = wake_windows[i] if i < len(wake_windows) else 180
+        intervals[2 * i + 1] = nap_durations[i] if i < len(nap_durations) else 60
+    intervals[-1] = night_sleep_window
+    intervals.flags.writeable = False
+    return intervals
 
 
 def predict_wake_time(night_sleep: str, model: dict[str, Any] | None = None) -> str:
@@ -191,11 +329,13 @@ def predict_wake_time(night_sleep: str, model: dict[str, Any] | None = None) ->
     if model is None:
         model = load_model()
 
-    night_time = parse_time(night_sleep)
-    duration = model.get("night_sleep_duration", 660)
-    wake_time = night_time + timedelta(minutes=duration)
+    return _predict_wake_time(night_sleep, model.get("night_sleep_duration", 660))
+
 
-    return format_time(wake_time)
+@lru_cache(maxsize=PREDICT_CACHE_SIZE)
+def _predict_wake_time(night_sleep: str, duration: int) -> str:
+    """Cached core of predict_wake_time."""
+    return format_minute(time_to_minutes(night_sleep) + duration)
 
 
 def recalculate(
@@ -207,58 +347,50 @@ def recalculate(
     if model is None:
         model = load_model()
 
-    schedule = {
-        "wake_time": wake_time,
-        "naps": [],
-        "night_sleep": None,
-        "night_predicted": True
-    }
+    # Correction per nap slot, None where the nap is still predicted. Later
+    # corrections for the same nap win; ones past the last nap are ignored.
+    naps_count = model["typical_naps_count"]
+    corrections_by_nap: list[dict[str, Any] | None] = [None] * naps_count
+    for c in corrections:
+        index = c["nap_number"] - 1
+        if 0 <= index < naps_count:
+            corrections_by_nap[index] = c
+
+    # Wake window and nap duration pairs, then the night window
+    intervals = _schedule_intervals(*_schedule_params(model)).tolist()
 
-    corrections_by_index = {c["nap_number"] - 1: c for c in corrections}
-    current_time = parse_time(wake_time)
+    # (start, end, duration, predicted) per nap, turned into dicts at the end
+    rows: list[tuple[str, str, int, bool]] = []
+    # Minutes since midnight; may run past 24 * 60, format_minute wraps it
+    current_min = time_to_minutes(wake_time)
 
-    for i in range(model["typical_naps_count"]):
-        if i in corrections_by_index:
-            corr = corrections_by_index[i]
+    for i in range(naps_count):
+        corr = corrections_by_nap[i]
+        nap_duration = intervals[2 * i + 1]
+
+        if corr is not None:
             nap_start = corr["start"]
             nap_end = corr.get("end")
 
             if nap_end:
-                duration = time_diff_minutes(nap_start, nap_end)
-                schedule["naps"].append({
-                    "start": nap_start,
-                    "end": nap_end,
-                    "duration_minutes": duration,
-                    "predicted": False
-                })
-                current_time = parse_time(nap_end)
+                rows.append((nap_start, nap_end, time_diff_minutes(nap_start, nap_end), False))
+                current_min = time_to_minutes(nap_end)
             else:
-                nap_duration = model["nap_durations"][i] if i < len(model["nap_durations"]) else 60
-                nap_end_dt = parse_time(nap_start) + timedelta(minutes=nap_duration)
-                schedule["naps"].append({
-                    "start": nap_start,
-                    "end": format_time(nap_end_dt),
-                    "duration_minutes": nap_duration,
-                    "predicted": True
-                })
-                current_time = nap_end_dt
+                current_min = time_to_minutes(nap_start) + nap_duration
+                rows.append((nap_start, format_minute(current_min), nap_duration, True))
         else:
-            wake_window = model["wake_windows"][i] if i < len(model["wake_windows"]) else 180
-            nap_duration = model["nap_durations"][i] if i < len(model["nap_durations"]) else 60
-
-            nap_start = current_time + timedelta(minutes=wake_window)
-            nap_end = nap_start + timedelta(minutes=nap_duration)
+            nap_start_min = current_min + intervals[2 * i]
+            current_min = nap_start_min + nap_duration
+            rows.append(
+                (format_minute(nap_start_min), format_minute(current_min), nap_duration, True)
+            )
 
-            schedule["naps"].append({
-                "start": format_time(nap_start),
-                "end": format_time(nap_end),
-                "duration_minutes": nap_duration,
-                "predicted": True
-            })
-
-            current_time = nap_end
-
-    night_time = current_time + timedelta(minutes=model["night_sleep_window"])
-    schedule["night_sleep"] = format_time(night_time)
-
-    return schedule
+    return {
+        "wake_time": wake_time,
+        "naps": [
+            {"start": start, "end": end, "duration_minutes": duration, "predicted": predicted}
+            for start, end, duration, predicted in rows
+        ],
+        "night_sleep": format_minute(current_min + intervals[-1]),
+        "night_predicted": True
+    }